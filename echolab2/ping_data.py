@@ -251,11 +251,10 @@ class PingData(object):
                                              start_ping=ping_number,
                                              end_ping=ping_number)[0]
 
-            # Create an index array.
-            replace_index = np.arange(new_pings) + replace_index
-
-            # Clamp the index to the length of our existing data.
-            replace_index = replace_index[replace_index < my_pings]
+            # Create an index array, clamping it to the length of our
+            # existing data.
+            replace_index = np.arange(replace_index,
+                                      min(replace_index + new_pings, my_pings))
 
         else:
             # An explicit array is provided.  These will be a vector of
@@ -1113,7 +1112,9 @@ class PingData(object):
         Args:
             obj (PingData): An empty object to copy attributes to.
             n_pings (int): Number of pings (horizontal axis)
-            value (int): A specified value to fill the array with.
+            value (int): A specified value to fill the array with. Set to None
+                to leave the 2d sample data arrays uninitialized. 1d arrays
+                are then filled with NaN.
             empty_times (bool): Controls whether ping_time data is copied
                 over to the new object (TRUE) or if it will be filled with NaT
                 values (FALSE).
@@ -1166,19 +1167,25 @@ class PingData(object):
                         if empty_times:
                             data[:] = np.datetime64('NaT')
                         else:
-                            data[:] = attr.copy()
+                            data[:] = attr
                     #    TODO:Other time based attributes are set to NaT.
                     #    Not sure if this is what we want to do, but not sure
                     #    what other time attributes would exist so this is what
                     #    we're doing for now.
                     elif data.dtype == 'datetime64[ms]':
                         data[:] = np.datetime64('NaT')
+                    elif value is None:
+                        data[:] = np.nan
                     else:
                         data[:] = value
+                elif value is None:
+                    # Create the 2d array(s) but leave them uninitialized.
+                    data = np.empty((n_pings, self.n_samples),
+                                    dtype=attr.dtype)
                 else:
-                    # Create the 2d array(s).
-                    data = np.empty((n_pings, self.n_samples), dtype=attr.dtype)
-                    data[:, :] = value
+                    # Create the 2d array(s) filled with the specified value.
+                    data = np.full((n_pings, self.n_samples), value,
+                                   dtype=attr.dtype)
 
             # Add the attribute to our empty object.  We can skip using
             # add_attribute here because we shouldn't need to check
@@ -251,7 +251,7 @@ class Line(PingData):
         """
 
         other_data = self._setup_numeric(other)
-        self.data[:] = self.data + other_data
+        np.add(self.data, other_data, out=self.data, casting='unsafe')
 
         return self
 
@@ -310,7 +310,7 @@ class Line(PingData):
             Original Line object with "other" subtracted from it.
         """
         other_data = self._setup_numeric(other)
-        self.data[:] = self.data - other_data
+        np.subtract(self.data, other_data, out=self.data, casting='unsafe')
 
         return self
 
@@ -370,7 +370,7 @@ class Line(PingData):
         """
 
         other_data = self._setup_numeric(other)
-        self.data[:] = self.data * other_data
+        np.multiply(self.data, other_data, out=self.data, casting='unsafe')
 
         return self
 
@@ -428,7 +428,7 @@ class Line(PingData):
         """
 
         other_data = self._setup_numeric(other)
-        self.data[:] = self.data / other_data
+        np.true_divide(self.data, other_data, out=self.data, casting='unsafe')
 
         return self
 
@@ -487,7 +487,7 @@ class Line(PingData):
         """
 
         other_data = self._setup_numeric(other)
-        self.data[:] = self.data ** other_data
+        np.power(self.data, other_data, out=self.data, casting='unsafe')
 
         return self
 
@@ -502,20 +502,16 @@ class Line(PingData):
             A message with basic information about the mask object.
         """
 
-        # Print the class and address.
-        msg = "{0} at {1}\n".format(str(self.__class__), str(hex(id(self))))
+        # Print the class and address.  The message is built as a list of
+        # strings which are joined once at the end.
+        msg = [str(self.__class__), " at ", str(hex(id(self))), "\n"]
 
         # Print some other basic information.
-        msg = "{0}                 line name: ({1})\n".format(msg, self.name)
-        msg = "{0}                 ping_time: ({1})\n".format(
-                                                    msg,
-                                                    self.ping_time.shape[0])
-        msg = "{0}                      data: ({1})\n".format(
-                                                            msg,
-                                                            self.data.shape[0])
-        msg = "{0}                start time: {1}\n".format(msg,
-                                                            self.ping_time[0])
-        msg = "{0}                  end time: {1}\n" .format(msg,
-                                                             self.ping_time[-1])
-
-        return msg
+        msg += ["                 line name: (", str(self.name), ")\n",
+                "                 ping_time: (", str(self.ping_time.shape[0]),
+                ")\n",
+                "                      data: (", str(self.data.shape[0]), ")\n",
+                "                start time: ", str(self.ping_time[0]), "\n",
+                "                  end time: ", str(self.ping_time[-1]), "\n"]
+
+        return "".join(msg)
@@ -45,6 +45,10 @@ class Mask(PingData):
         color (array):
         name (str):
         sample_offset:
+        mask (array): A numpy bool array containing the mask.  Sample masks
+            are (n_pings, n_samples) and ping masks are (n_pings).  The array
+            can be used directly to index sample data (data[mask.mask]),
+            which is much faster than indexing with np.where(mask.mask).
     """
 
     def __init__(self, size=None, like=None, value=False, type='sample',
@@ -55,8 +59,10 @@ class Mask(PingData):
         """
         super(Mask, self).__init__()
 
-        # Ensure the value arg is a bool.
-        value = bool(value)
+        # Ensure the value arg is a bool.  None is passed through to "like"
+        # which will leave the mask array uninitialized.
+        if value is not None:
+            value = bool(value)
 
         # Set the initial attribute values.
         self.type = type
@@ -121,7 +127,9 @@ class Mask(PingData):
 
         Args:
             like_obj (ProcessedData obj): The object to base the mask off of.
-            value (bool): Set to True to fill array with values.
+            value (bool): Set to True to fill array with values. Set to None
+                to leave the mask array uninitialized. This is useful when the
+                caller will immediately overwrite the entire mask.
             mask_type (str): The mask type.
 
         Raise:
@@ -131,7 +139,8 @@ class Mask(PingData):
         """
 
         # Ensure the value arg is a bool.
-        value = bool(value)
+        if value is not None:
+            value = bool(value)
 
         # Copy attributes common to both mask types.
         self.n_pings = like_obj.n_pings
@@ -151,12 +160,16 @@ class Mask(PingData):
                 self.type = 'sample'
 
                 # Create a 2d mask array.
-                self.mask = np.full((like_obj.n_pings, like_obj.n_samples),
-                                    value, dtype=bool)
+                if value is None:
+                    self.mask = np.empty((like_obj.n_pings,
+                                          like_obj.n_samples), dtype=bool)
+                else:
+                    self.mask = np.full((like_obj.n_pings, like_obj.n_samples),
+                                        value, dtype=bool)
                 self.n_samples = like_obj.n_samples
 
                 # Get the range or depth vector
-                if hasattr(like_obj, 'range'):
+                if 'range' in like_obj.__dict__:
                     self.range = like_obj.range.copy()
                 else:
                     self.depth = like_obj.depth.copy()
@@ -168,7 +181,10 @@ class Mask(PingData):
                 self.n_samples = 0
 
                 # Create a 1D mask that is n_pings long.
-                self.mask = np.full(like_obj.n_pings, value, dtype=bool)
+                if value is None:
+                    self.mask = np.empty(like_obj.n_pings, dtype=bool)
+                else:
+                    self.mask = np.full(like_obj.n_pings, value, dtype=bool)
 
             else:
                 raise TypeError('Unknown mask type: ' + mask_type)
@@ -178,13 +194,18 @@ class Mask(PingData):
             # attributes.
             self.type = like_obj.type
             self.n_samples = like_obj.n_samples
-            if hasattr(like_obj, 'range'):
+
+            # Ping masks don't have a vertical axis.
+            if 'range' in like_obj.__dict__:
                 self.range = like_obj.range.copy()
-            else:
+            elif 'depth' in like_obj.__dict__:
                 self.depth = like_obj.depth.copy()
 
             # Set the mask data.
-            self.mask = np.full(like_obj.mask.shape, value, dtype=bool)
+            if value is None:
+                self.mask = np.empty(like_obj.mask.shape, dtype=bool)
+            else:
+                self.mask = np.full(like_obj.mask.shape, value, dtype=bool)
 
         else:
             # We only can base masks on ProcessedData or mask objects.
@@ -207,7 +228,7 @@ class Mask(PingData):
 
         # Copy the vertical axis for sample masks.
         if self.type.lower() == 'sample':
-            if hasattr(self, 'range'):
+            if 'range' in self.__dict__:
                 mask_copy.range = self.range.copy()
             else:
                 mask_copy.depth = self.depth.copy()
@@ -244,7 +265,7 @@ class Mask(PingData):
         # Ensure value is a bool.
         value = bool(value)
 
-        if hasattr(self, 'range'):
+        if 'range' in self.__dict__:
             v_axis = self.range
         else:
             v_axis = self.depth
@@ -283,7 +304,7 @@ class Mask(PingData):
                             'must convert it to a sample mask first.')
 
         # Get a reference to the vertical axis.
-        if hasattr(self, 'range'):
+        if 'range' in self.__dict__:
             v_axis = self.range
         else:
             v_axis = self.depth
@@ -316,7 +337,8 @@ class Mask(PingData):
             # Check that the two masks are the same shape and share common axes.
             other_mask, ret_mask = self._check_mask(other)
 
-            return np.all(ret_mask.mask == other.mask)
+            return np.all(self._operand(other_mask) ==
+                    other_mask._operand(self))
         except:
             return False
 
@@ -334,7 +356,8 @@ class Mask(PingData):
             #  check that the two masks are the same shape and share common axes
             other_mask, ret_mask = self._check_mask(other)
 
-            return np.any(ret_mask.mask != other.mask)
+            return np.any(self._operand(other_mask) !=
+                    other_mask._operand(self))
         except:
             return False
 
@@ -378,7 +401,8 @@ class Mask(PingData):
         other_mask, ret_mask = self._check_mask(other)
 
         # Set the mask.
-        ret_mask.mask[:] = self.mask & other_mask.mask
+        ret_mask.mask[:] = (self._operand(other_mask) &
+                other_mask._operand(self))
 
         # Return the result.
         return ret_mask
@@ -410,7 +434,7 @@ class Mask(PingData):
         other_mask, ret_mask = self._check_mask(other, inplace=True)
 
         # Set the mask.
-        ret_mask.mask[:] = self.mask & other_mask.mask
+        ret_mask.mask[:] = self.mask & other_mask._operand(self)
 
         # Return the result.
         return ret_mask
@@ -429,7 +453,8 @@ class Mask(PingData):
         other_mask, ret_mask = self._check_mask(other)
 
         # Set the mask.
-        ret_mask.mask[:] = self.mask | other_mask.mask
+        ret_mask.mask[:] = (self._operand(other_mask) |
+                other_mask._operand(self))
 
         # Return the result.
         return ret_mask
@@ -461,7 +486,7 @@ class Mask(PingData):
         other_mask, ret_mask = self._check_mask(other, inplace=True)
 
         # Set the mask.
-        ret_mask.mask[:] = self.mask | other_mask.mask
+        ret_mask.mask[:] = self.mask | other_mask._operand(self)
 
         # Return the result.
         return ret_mask
@@ -480,7 +505,8 @@ class Mask(PingData):
         other_mask, ret_mask = self._check_mask(other)
 
         # Set the mask.
-        ret_mask.mask[:] = self.mask ^ other_mask.mask
+        ret_mask.mask[:] = (self._operand(other_mask) ^
+                other_mask._operand(self))
 
         # Return the result.
         return ret_mask
@@ -512,7 +538,7 @@ class Mask(PingData):
         other_mask, ret_mask = self._check_mask(other, inplace=True)
 
         # Set the mask.
-        ret_mask.mask[:] = self.mask ^ other_mask.mask
+        ret_mask.mask[:] = self.mask ^ other_mask._operand(self)
 
         # Return the result.
         return ret_mask
@@ -562,12 +588,28 @@ class Mask(PingData):
         self.mask = new_mask.mask
 
 
+    def _operand(self, other_mask):
+        """Returns this mask's array shaped for an operation with other_mask.
+
+        When a ping mask is combined with a sample mask, the ping mask is
+        broadcast across the samples.
+
+        Args:
+            other_mask (Mask obj): The mask this mask is combined with.
+
+        Returns:
+            This mask's array or a broadcastable view of it.
+        """
+        if self.type == 'ping' and other_mask.type == 'sample':
+            return self.mask[:, np.newaxis]
+        return self.mask
+
+
     def _check_mask(self, other, inplace=False):
         """Checks that the dimensions and axes values match.
 
-        _check_mask ensures that the dimensions and axes values match. If
-        possible, it will coerce a ping mask to a sample mask by vertically
-        expanding the ping mask.
+        _check_mask ensures that the dimensions and axes values match. A ping
+        mask can be combined with a sample mask, the result is a sample mask.
 
         Args:
             other (Mask obj): A given mask object to compare.
@@ -591,16 +633,19 @@ class Mask(PingData):
         if not np.array_equal(self.ping_time, other.ping_time):
             raise ValueError('Mask ping times do not match.')
 
-        # Make sure the vertical axes are the same (if present).
-        if hasattr(self, 'range'):
-            if hasattr(other, 'range'):
+        # Make sure the vertical axes are the same (if present).  Ping masks
+        # don't have a vertical axis.
+        if self.type == 'ping' or other.type == 'ping':
+            pass
+        elif 'range' in self.__dict__:
+            if 'range' in other.__dict__:
                 if not np.array_equal(self.range, other.range):
                     raise ValueError('Mask ranges do not match.')
             else:
                 raise AttributeError('You cannot apply a range based mask to '
                                      'a depth based mask.')
         else:
-            if hasattr(other, 'depth'):
+            if 'depth' in other.__dict__:
                 if not np.array_equal(self.depth, other.depth):
                     raise ValueError('Mask depths do not match.')
             else:
@@ -618,22 +663,13 @@ class Mask(PingData):
                 raise AttributeError('You cannot apply a sample based mask ' +
                         'to a ping based mask in-place')
             else:
-                # Create a new 2d mask based on the "other" sample mask.
-                ret_mask = mask(like=other)
-
-                # Set all samples to true for each ping set true in the this
-                # mask.
-                ret_mask.mask[self.mask, :] = True
-        elif self.type == 'sample' and other.type == 'ping':
-            # Coerce the other mask to a sample mask.
-            other_mask = mask(like=self)
+                # The result is a sample mask.  Every element is set by the
+                # operators so the new mask array isn't initialized.
+                ret_mask = Mask(like=other, value=None)
 
-            # Set all samples to true for each ping set true in the other mask.
-            other_mask.mask[other.mask, :] = True
-
-        else:
-            # Mask types match, nothing to do.
-            other_mask = other
+        # The other mask is used as is.  When ping and sample masks are
+        # combined, _operand broadcasts the ping mask across the samples.
+        other_mask = other
 
         if ret_mask is None:
             # We didn't have to coerce the return mask so set the return mask
@@ -657,20 +693,20 @@ class Mask(PingData):
 
         """
 
-        # Print the class and address.
-        msg = str(self.__class__) + " at " + str(hex(id(self))) + "\n"
+        # Print the class and address.  The message is built as a list of
+        # strings which are joined once at the end.
+        msg = [str(self.__class__), " at ", str(hex(id(self))), "\n"]
 
         # Some other basic information.
-        msg = msg + "                 mask name: " + self.name + "\n"
-        msg = msg + "                      type: " + self.type + "\n"
-        msg = msg + "                     color: " + str(self.color) + "\n"
+        msg += ["                 mask name: ", self.name, "\n",
+                "                      type: ", self.type, "\n",
+                "                     color: ", str(self.color), "\n"]
         if self.type.lower() == 'ping':
-            msg = (msg + "                dimensions: (" + str(self.n_pings)
-                   + ")\n")
+            msg += ["                dimensions: (", str(self.n_pings), ")\n"]
         else:
-            msg = (msg + "                dimensions: (" + str(self.n_pings)
-                   + "," + str(self.n_samples) + ")\n")
-            msg = (msg + "             sample offset: " + str(
-                self.sample_offset) + "\n")
+            msg += ["                dimensions: (", str(self.n_pings), ",",
+                    str(self.n_samples), ")\n",
+                    "             sample offset: ", str(self.sample_offset),
+                    "\n"]
 
-        return msg
+        return "".join(msg)
@@ -33,6 +33,285 @@ import numpy as np
 from ..ping_data import PingData
 from ..processing import mask
 
+try:
+    # Numba is optional.  If it is available, it is used to compile some of
+    # the sample data interpolation and comparison methods.
+    import numba
+except ImportError:
+    numba = None
+
+# The minimum number of samples for which the compiled comparison kernel is
+# used.  Below this, the cost of calling into the kernel is greater than the
+# benefit of comparing the pings in parallel.
+_COMPILED_COMPARE_MIN_SIZE = 1 << 20
+
+# The sample data types handled by the compiled kernels.  Numba doesn't
+# support float16 arithmetic, other types are handled by numpy.
+_COMPILED_DTYPES = (np.dtype('float32'), np.dtype('float64'))
+
+
+def _interp_weights(old_axis, new_axis, shifts=None):
+    """Computes the indices and weights used to linearly interpolate sample
+    data from one vertical axis to another.
+
+    If shifts is provided, the samples of each ping are located at
+    old_axis + shifts[ping] and the weights are returned as 2d arrays
+    (n_pings, len(new_axis)).  The old axis must be monotonically increasing.
+
+    Args:
+        old_axis (array): A 1d numpy array containing the vertical axis of the
+            existing sample data.
+        new_axis (array): A 1d numpy array containing the vertical axis we
+            are interpolating to.
+        shifts (array): A 1d numpy array containing the vertical shift of
+            each ping.  Set to None if the pings are not shifted.
+
+    Returns:
+        The index of the left neighbor of each new sample, the weight of the
+        right neighbor and a boolean array that is True where the new axis
+        falls outside of the old axis.
+    """
+    last = old_axis.shape[0] - 2
+
+    if shifts is None:
+        # Find the left neighbor of each new sample.  Using side='right'
+        # ensures that new samples that fall on an existing sample get a
+        # weight of 0.
+        idx = np.searchsorted(old_axis, new_axis, side='right') - 1
+        np.clip(idx, 0, last, out=idx)
+        left_axis = old_axis[idx]
+        right_axis = old_axis[idx + 1]
+        first_axis = old_axis[0]
+        last_axis = old_axis[-1]
+    else:
+        # Like np.interp, the neighbors, weights and bounds are computed in
+        # shifted space.  The neighbors are found on the unshifted axis and
+        # then stepped where rounding put a new sample on the wrong side of
+        # a shifted neighbor.
+        shifts = shifts[:, np.newaxis]
+        idx = np.searchsorted(old_axis, new_axis - shifts, side='right') - 1
+        np.clip(idx, 0, last, out=idx)
+        idx -= (old_axis[idx] + shifts > new_axis) & (idx > 0)
+        idx += (old_axis[idx + 1] + shifts <= new_axis) & (idx < last)
+        left_axis = old_axis[idx] + shifts
+        right_axis = old_axis[idx + 1] + shifts
+        first_axis = old_axis[0] + shifts
+        last_axis = old_axis[-1] + shifts
+
+    # Compute the weight of the right neighbor.
+    weight = (new_axis - left_axis) / (right_axis - left_axis)
+
+    # Determine which new samples are outside of the old axis.
+    out_of_bounds = (new_axis < first_axis) | (new_axis > last_axis)
+
+    return idx, weight, out_of_bounds
+
+
+def _interp_samples(data, idx, weight, out_of_bounds, is_log=False):
+    """Linearly interpolates 2d sample data given the indices and weights
+    returned by _interp_weights.
+
+    This produces the same result as calling np.interp on each ping with
+    left and right set to NaN, without looping over the pings.
+
+    Args:
+        data (array): A 2d numpy array (n_pings, n_samples) of sample data.
+        idx (array): The left neighbor indices.
+        weight (array): The right neighbor weights.
+        out_of_bounds (array): A boolean array that is True where the new
+            samples fall outside the old vertical axis.
+        is_log (bool): Set to True if the sample data are in log form. The
+            data will be interpolated in linear units and the result
+            returned in log form.
+
+    Returns:
+        A new 2d numpy array containing the interpolated sample data.  Integer
+        and bool sample data are returned as float64.
+    """
+    # Integer and bool sample data can't hold the NaNs of samples outside of
+    # the old axis so they are interpolated in float64.
+    if data.dtype.kind not in 'fc':
+        data = data.astype('float64')
+
+    # Determine which new samples fall exactly on an existing sample.  This
+    # must be done with the float64 weights since casting them to float32
+    # rounds weights within an ulp of 0 or 1 to exact hits.
+    at_left = weight == 0
+    at_right = weight == 1
+
+    # Do the math in the precision of the sample data.  Mixing in the float64
+    # weights would upcast float32 sample data.  The left weights are
+    # computed before the cast so weights near 1 don't lose precision.
+    dtype = data.dtype.type
+    left_weight = (1.0 - weight).astype(data.dtype, copy=False)
+    weight = weight.astype(data.dtype, copy=False)
+
+    # Make sure the index arrays can be broadcast across the pings.
+    if idx.ndim == 1:
+        idx = idx[np.newaxis, :]
+        weight = weight[np.newaxis, :]
+        left_weight = left_weight[np.newaxis, :]
+        at_left = at_left[np.newaxis, :]
+        at_right = at_right[np.newaxis, :]
+        out_of_bounds = out_of_bounds[np.newaxis, :]
+
+    # Gather the left and right neighbors of each new sample.
+    left = np.take_along_axis(data, idx, axis=1)
+    right = np.take_along_axis(data, idx + 1, axis=1)
+
+    # If required, convert the neighbors to linear units.  Only the gathered
+    # samples are converted, the sample data array is left untouched.
+    if is_log:
+        for neighbor in (left, right):
+            neighbor *= dtype(0.1)
+            np.power(dtype(10.0), neighbor, out=neighbor)
+
+    # Interpolate, computing left * (1 - weight) + right * weight.  The
+    # neighbors are kept since they are needed for exact hits below.
+    interp_data = np.multiply(left, left_weight)
+    interp_data += right * weight
+
+    # Like np.interp, return the existing sample when a new sample falls
+    # exactly on it.  This keeps NaN neighbors from leaking into the result.
+    np.copyto(interp_data, left, where=at_left)
+    np.copyto(interp_data, right, where=at_right)
+
+    # Samples outside of the old axis are set to NaN.
+    np.copyto(interp_data, np.nan, where=out_of_bounds)
+
+    # Convert the result back to log units if required.
+    if is_log:
+        np.log10(interp_data, out=interp_data)
+        interp_data *= dtype(10.0)
+
+    return interp_data.astype(data.dtype, copy=False)
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _batched_interp(out, data, old_axis, new_axis, shifts, is_log):
+        """Linearly interpolates each ping of 2d sample data, shifted
+        vertically, to a new vertical axis.
+
+        The samples of each ping are located at old_axis + shifts[ping].
+        This produces the same result as _interp_samples but works through
+        the pings in parallel without building the (n_pings, n_samples)
+        shifted axis, indices and weights.  Both axes must be monotonically
+        increasing.
+
+        Args:
+            out (array): A 2d numpy array (n_pings, len(new_axis)) that the
+                interpolated sample data are written to.
+            data (array): A 2d numpy array (n_pings, len(old_axis)) of sample
+                data.
+            old_axis (array): The monotonically increasing vertical axis of
+                the unshifted sample data.
+            new_axis (array): The monotonically increasing vertical axis we
+                are interpolating to.
+            shifts (array): The vertical shift of each ping.
+            is_log (bool): Set to True if the sample data are in log form.
+        """
+        n_old = old_axis.shape[0]
+        for ping in numba.prange(out.shape[0]):
+            # Like np.interp, the bounds, neighbors and weights are computed
+            # in shifted space.  Since the new axis is increasing, the left
+            # neighbor only ever moves forward as we work down the ping.
+            shift = shifts[ping]
+            i = 0
+            for j in range(out.shape[1]):
+                x = new_axis[j]
+                if (x < old_axis[0] + shift or
+                        x > old_axis[n_old - 1] + shift):
+                    out[ping, j] = np.nan
+                    continue
+                while i < n_old - 2 and old_axis[i + 1] + shift <= x:
+                    i += 1
+
+                left = data[ping, i]
+                right = data[ping, i + 1]
+                if is_log:
+                    left = 10.0 ** (left / 10.0)
+                    right = 10.0 ** (right / 10.0)
+
+                left_x = old_axis[i] + shift
+                weight = (x - left_x) / (old_axis[i + 1] + shift - left_x)
+                if weight == 0:
+                    value = left
+                elif weight == 1:
+                    value = right
+                else:
+                    value = left * (1.0 - weight) + right * weight
+
+                if is_log:
+                    value = 10.0 * np.log10(value)
+                out[ping, j] = value
+
+
+    @numba.njit(parallel=True, cache=True)
+    def _compare_scalar(out, data, value, op):
+        """Compares 2d sample data to a scalar value, writing the results
+        into out.
+
+        This is not compiled with fastmath since comparisons with NaN must
+        return False (or True for "not equal").
+
+        Args:
+            out (array): A 2d boolean numpy array the same shape as data.
+            data (array): A 2d numpy array of sample data.
+            value (float): The value to compare the sample data to.
+            op (int): The comparison to apply.  See _COMPARE_OPS.
+        """
+        n_samples = data.shape[1]
+        for ping in numba.prange(data.shape[0]):
+            # Each comparison has its own inner loop so the loops can be
+            # vectorized.
+            if op == 0:
+                for j in range(n_samples):
+                    out[ping, j] = data[ping, j] > value
+            elif op == 1:
+                for j in range(n_samples):
+                    out[ping, j] = data[ping, j] < value
+            elif op == 2:
+                for j in range(n_samples):
+                    out[ping, j] = data[ping, j] >= value
+            elif op == 3:
+                for j in range(n_samples):
+                    out[ping, j] = data[ping, j] <= value
+            elif op == 4:
+                for j in range(n_samples):
+                    out[ping, j] = data[ping, j] == value
+            else:
+                for j in range(n_samples):
+                    out[ping, j] = data[ping, j] != value
+
+
+    @numba.njit(parallel=True, cache=True)
+    def _greater_multi(out, data, thresholds):
+        """Compares 2d sample data to a number of thresholds in a single pass,
+        writing the results of data > thresholds[k] into out[k].
+
+        Each ping is compared to all of the thresholds while its samples are
+        in cache.  The thresholds are the outer loop so the inner loop reads
+        and writes contiguous samples and can be vectorized.
+
+        Args:
+            out (array): A 3d boolean numpy array (n_thresholds, n_pings,
+                n_samples).
+            data (array): A 2d numpy array of sample data.
+            thresholds (array): A 1d numpy array of thresholds.
+        """
+        n_samples = data.shape[1]
+        for ping in numba.prange(data.shape[0]):
+            for k in range(thresholds.shape[0]):
+                threshold = thresholds[k]
+                for j in range(n_samples):
+                    out[k, ping, j] = data[ping, j] > threshold
+
+
+# Map the comparison ufuncs to the op codes used by _compare_scalar.
+_COMPARE_OPS = {np.greater: 0, np.less: 1, np.greater_equal: 2,
+                np.less_equal: 3, np.equal: 4, np.not_equal: 5}
+
 
 @implements_iterator
 class ProcessedData(PingData):
@@ -152,6 +431,74 @@ class ProcessedData(PingData):
         # offset away from the transducer face.
         self.sample_offset = 0
 
+        # The name of our vertical axis attribute, 'range' or 'depth'.  This
+        # is set when the vertical axis attribute is added and is None when
+        # neither exist.
+        self._vaxis_name = None
+
+        # A list of the names of the 2d data attributes.  This is maintained
+        # by add_attribute and remove_attribute so methods that only operate
+        # on the sample data don't have to check each data attribute.
+        self._2d_attributes = []
+
+
+    @property
+    def _vaxis(self):
+        """Returns a reference to the vertical axis (range or depth) data.
+
+        Raises:
+            AttributeError: Range and depth missing.
+        """
+        if self._vaxis_name is None:
+            raise AttributeError('The data object has neither'
+                                 ' a range nor depth attribute.')
+        return getattr(self, self._vaxis_name)
+
+
+    def add_attribute(self, name, data):
+        """Adds a "data attribute" to the class.
+
+        This method re-implements PingData.add_attribute, tracking the name
+        of the vertical axis attribute when range or depth is added and the
+        names of the 2d attributes.
+
+        2d attributes are stored as C-contiguous arrays.  If a non-contiguous
+        array (e.g. a transposed or strided view) is provided, it is copied
+        so numpy can operate on the sample data without buffering.
+
+        Args:
+            name (str): The attribute name to be added to the class.
+            data (array): A numpy array containing the data attributes.
+        """
+        if (isinstance(data, np.ndarray) and data.ndim == 2 and
+                not data.flags.c_contiguous):
+            data = np.ascontiguousarray(data)
+
+        super(ProcessedData, self).add_attribute(name, data)
+
+        if name in ('range', 'depth'):
+            self._vaxis_name = name
+        elif data.ndim == 2 and name not in self._2d_attributes:
+            self._2d_attributes.append(name)
+
+
+    def remove_attribute(self, name):
+        """Removes a data attribute from the object.
+
+        This method re-implements PingData.remove_attribute, clearing the
+        name of the vertical axis attribute if range or depth is removed and
+        updating the list of 2d attributes.
+
+        Args:
+            name (str): The attribute name to be removed from the class.
+        """
+        super(ProcessedData, self).remove_attribute(name)
+
+        if name == self._vaxis_name:
+            self._vaxis_name = None
+        elif name in self._2d_attributes:
+            self._2d_attributes.remove(name)
+
 
     def replace(self, obj_to_insert, ping_number=None, ping_time=None,
                 index_array=None):
@@ -182,46 +529,73 @@ class ProcessedData(PingData):
             TypeError: Data isn't the same type.
         """
 
-        # Determine how many pings we're inserting.
-        if index_array:
+        if obj_to_insert is None:
+            # Determine how many pings we're replacing.
+            if index_array is None:
+                idx = self._get_ping_index(ping_number, ping_time)
+                index_array = np.arange(idx, self.n_pings)
             n_inserting = index_array.shape[0]
-        else:
-            idx = self.get_indices(start_time=ping_time, end_time=ping_time,
-                    start_ping=ping_number, end_ping=ping_number)[0]
-            n_inserting = self.n_pings - idx
-            index_array = np.arange(n_inserting) + idx
 
-        if obj_to_insert is None:
             # When obj_to_insert is None, we automatically create a matching
             # object that contains no data (all NaNs).
             obj_to_insert = self.empty_like(n_inserting, empty_times=True)
 
             # When replacing, we copy the ping times.
-            obj_to_insert.ping_times = self.ping_times[index_array]
+            obj_to_insert.ping_time = self.ping_time[index_array]
 
         # When inserting/replacing data in ProcessedData objects we have to
         # make sure the data are the same type. The parent method will check
         # if the frequencies are the same.
         if self.data_type != obj_to_insert.data_type:
             raise TypeError('You cannot replace data in an object that '
-                            'contains ' + self.data_type.data_type + ' data '
+                            'contains ' + self.data_type + ' data '
                             'using an object that contains ' +
                             obj_to_insert.data_type + ' data.')
 
-        # Get our range/depth vector.
-        if hasattr(self, 'range'):
-            this_vaxis = getattr(self, 'range')
-        else:
-            this_vaxis = getattr(self, 'depth')
-
         # Interpolate the object we're inserting to our vertical axis (if
         # the vertical axes are the same interpolate will return w/o doing
         # anything).
-        obj_to_insert.interpolate(this_vaxis)
+        obj_to_insert.interpolate(self._vaxis)
 
-        # We are now coexisting in harmony - call parent's insert.
-        super(ProcessedData, self).replace( obj_to_insert, ping_number=None,
-                ping_time=None, insert_after=True, index_array=None)
+        # We are now coexisting in harmony - call parent's replace.
+        super(ProcessedData, self).replace(obj_to_insert,
+                                           ping_number=ping_number,
+                                           ping_time=ping_time,
+                                           index_array=index_array,
+                                           _ignore_vertical_axes=True)
+
+
+    def _get_ping_index(self, ping_number, ping_time):
+        """Returns the index of the ping specified by ping number or time.
+
+        This is a shortcut for get_indices when a single ping is specified.
+        Ping numbers start at 1.
+
+        Args:
+            ping_number (int): The ping number of the ping.
+            ping_time (datetime64): The ping time of the ping.
+
+        Returns:
+            The index of the ping.
+
+        Raises:
+            ValueError: ping_number or ping_time not provided.
+            IndexError: The ping doesn't exist.
+        """
+        if ping_time is not None:
+            idx = np.flatnonzero(self.ping_time == ping_time)
+            if idx.shape[0] == 0:
+                raise IndexError('The ping time ' + str(ping_time) +
+                                 ' does not exist in this object.')
+            return idx[0]
+        elif ping_number is not None:
+            if ping_number < 1 or ping_number > self.n_pings:
+                raise IndexError('The ping number ' + str(ping_number) +
+                                 ' does not exist in this object.')
+            return int(ping_number) - 1
+        else:
+            raise ValueError('Either ping_number or ping_time needs to be '
+                             'defined or an index array needs to be provided.')
 
 
     def get_v_axis(self):
@@ -230,12 +604,9 @@ class ProcessedData(PingData):
         for example:
             [[1,2,3,4], 'range']
         """
-        if hasattr(self, 'range'):
-            #  this is range based data
-            return [getattr(self, 'range'), 'range']
-        elif hasattr(self, 'depth'):
-             #  this is depth based data
-            return [getattr(self, 'depth'), 'depth']
+        if self._vaxis_name is not None:
+            #  this is range or depth based data
+            return [self._vaxis, self._vaxis_name]
         else:
             #  we don't seem to have either range or depth
             return [[], 'none']
@@ -267,14 +638,14 @@ class ProcessedData(PingData):
                 are ignored.
         """
         # Determine how many pings we're inserting.
-        if index_array is None:
-            in_idx = self.get_indices(start_time=ping_time, end_time=ping_time,
-                    start_ping=ping_number, end_ping=ping_number)[0]
-            n_inserting = self.n_pings - in_idx
-        else:
-            n_inserting = index_array.shape[0]
-
         if obj_to_insert is None:
+            # Determine how many pings we're inserting.
+            if index_array is None:
+                in_idx = self._get_ping_index(ping_number, ping_time)
+                n_inserting = self.n_pings - in_idx
+            else:
+                n_inserting = index_array.shape[0]
+
             # When obj_to_insert is None, we create automatically create a
             # matching object that contains no data (all NaNs).
             obj_to_insert = self.empty_like(n_inserting, empty_times=True)
@@ -285,16 +656,10 @@ class ProcessedData(PingData):
                     obj_to_insert.data_type + ' data into an object that ' +
                     'contains ' + self.data_type + ' data.')
 
-        # Get our range/depth vector.
-        if hasattr(self, 'range'):
-            this_vaxis = getattr(self, 'range')
-        else:
-            this_vaxis = getattr(self, 'depth')
-
         # Interpolate the object we're inserting to our vertical axis (if the
         # vertical axes are the same interpolate will return w/o doing
         # anything).
-        obj_to_insert.interpolate(this_vaxis)
+        obj_to_insert.interpolate(self._vaxis)
 
         # We are now coexisting in harmony - call parent's insert.
         super(ProcessedData, self).insert(obj_to_insert,
@@ -305,13 +670,16 @@ class ProcessedData(PingData):
 
 
     def empty_like(self, n_pings=None, empty_times=False, channel_id=None,
-            data_type=None, is_log=False):
+            data_type=None, is_log=False, fill=True):
         """Returns an object filled with NaNs.
 
         This method returns a ProcessedData object with the same general
         characteristics of "this" object with all of the data arrays
         filled with NaNs.
 
+        If the caller is going to overwrite all of the sample data, set fill
+        to False to skip filling the 2d sample data arrays.
+
         Args:
             n_pings: Set n_pings to an integer specifying the number of pings
                 in the new object. By default the number of pings will match
@@ -330,6 +698,10 @@ class ProcessedData(PingData):
                 can be used to identify derived or synthetic data types.
             is_log: Set this to True if the new ProcessedData object will
                 contain data in log form. Set it to False if not.
+            fill: Set this to False to leave the 2d sample data arrays
+                uninitialized. Other per ping attributes are still filled with
+                NaNs and the vertical axis and ping_time are set as described
+                above.
 
         Returns:
             An empty ProcessedData object.
@@ -351,9 +723,15 @@ class ProcessedData(PingData):
         empty_obj.sample_thickness = self.sample_thickness
         empty_obj.sample_offset = self.sample_offset
         empty_obj.is_log = is_log
+        empty_obj._vaxis_name = self._vaxis_name
+        empty_obj._2d_attributes = list(self._2d_attributes)
 
         # Call the parent _like helper method and return the result.
-        return self._like(empty_obj, n_pings, np.nan, empty_times=empty_times)
+        if fill:
+            value = np.nan
+        else:
+            value = None
+        return self._like(empty_obj, n_pings, value, empty_times=empty_times)
 
 
     def zeros_like(self, n_pings=None, empty_times=False, channel_id=None,
@@ -399,10 +777,12 @@ class ProcessedData(PingData):
 
         # Get an empty ProcessedData object "like" this object.
         empty_obj = ProcessedData(channel_id, self.frequency,
-                self.data_type)
+                data_type)
         empty_obj.sample_thickness = self.sample_thickness
         empty_obj.sample_offset = self.sample_offset
         empty_obj.is_log = is_log
+        empty_obj._vaxis_name = self._vaxis_name
+        empty_obj._2d_attributes = list(self._2d_attributes)
 
         # Call the parent _like helper method and return the result.
         return self._like(empty_obj, n_pings, 0.0,
@@ -421,6 +801,8 @@ class ProcessedData(PingData):
         pd_copy.sample_thickness = self.sample_thickness
         pd_copy.sample_offset = self.sample_offset
         pd_copy.is_log = self.is_log
+        pd_copy._vaxis_name = self._vaxis_name
+        pd_copy._2d_attributes = list(self._2d_attributes)
 
         # Call the parent _copy helper method and return the result.
         return self._copy(pd_copy)
@@ -465,6 +847,8 @@ class ProcessedData(PingData):
         p_data.frequency = self.frequency
         p_data._data_attributes = list(self._data_attributes)
         p_data.is_log = self.is_log
+        p_data._vaxis_name = self._vaxis_name
+        p_data._2d_attributes = list(self._2d_attributes)
 
         # Work through the data attributes, slicing them and adding to the new
         # ProcessedData object.
@@ -509,23 +893,28 @@ class ProcessedData(PingData):
         Args:
             n_samples (int): The number of samples to shift the data array by.
         """
-        # Store the old sample number.
-        old_samples = self.n_samples
+        # Determine the new number of samples.
+        old_n_samples = self.n_samples
+        new_n_samples = old_n_samples + n_samples
 
-        # Resize the sample data arrays.
-        self.resize(self.n_pings, self.n_samples + n_samples)
+        # Shift and pad the 2d data arrays.  We create new NaN filled arrays
+        # and copy the existing data in below the padding.
+        for attr_name in self._2d_attributes:
+            attr = getattr(self, attr_name)
+            new_attr = np.full((self.n_pings, new_n_samples), np.nan,
+                    dtype=attr.dtype)
+            new_attr[:, n_samples:] = attr
+            setattr(self, attr_name, new_attr)
 
         # Generate the new range/depth array.
-        if hasattr(self, 'range'):
-            attr = getattr(self, 'range')
-        else:
-            attr = getattr(self, 'depth')
-        attr[:] = ((np.arange(self.n_samples) - n_samples) *
-                   self.sample_thickness + attr[0])
+        vaxis = self._vaxis
+        dtype = vaxis.dtype.type
+        new_vaxis = ((np.arange(-n_samples, old_n_samples, dtype=vaxis.dtype) *
+                     dtype(self.sample_thickness)) + vaxis[0])
+        setattr(self, self._vaxis_name, new_vaxis)
 
-        # Shift and pad the data array.
-        self.data[:,n_samples:] = attr[:,0:old_samples]
-        self.data[:,0:n_samples] = np.nan
+        # Update the sample count.
+        self.n_samples = new_n_samples
 
 
     def shift_pings(self, vert_shift, to_depth=False):
@@ -540,6 +929,9 @@ class ProcessedData(PingData):
             to_depth (bool): Set to_depth to True if you are converting from
                 range to depth.  This option will remove the range attribute
                 and replace it with the depth attribute.
+
+        Raises:
+            ValueError: The vertical shift vector isn't n_pings long.
         """
         # Determine the vertical extent of the shift.
         min_shift = np.min(vert_shift)
@@ -547,49 +939,57 @@ class ProcessedData(PingData):
         vert_ext = max_shift - min_shift
 
         # Determine our vertical axis - this has to be range or depth.
-        if hasattr(self, 'range'):
-            vert_axis = self.range
-        else:
-            vert_axis = self.depth
+        vert_axis = self._vaxis
+        vert_axis_name = self._vaxis_name
+        if vert_axis_name == 'depth':
             # If we've already converted to depth, unset the to_depth keyword.
             to_depth = False
 
-        # If there is a new vertical extent resize our arrays.
+        # Determine the number of samples in the shifted data.
+        new_sample_dim = self.n_samples
         if vert_ext != 0:
-            # Determine the number of new samples as a result of the shift.
-            new_samps = (np.ceil(vert_ext.astype('float32') /
-                    self.sample_thickness)).astype('uint')
-            # Calculate new sample dimension.
-            new_sample_dim = (self.n_samples + new_samps).astype('uint')
-            # Resize array (n_samples will be updated in the _resize method).
-            old_samps = self.n_samples
-            self.resize(self.n_pings, new_sample_dim)
-
-        # Create the new vertical axis.
-        new_axis = (np.arange(self.n_samples) * self.sample_thickness) + \
-                np.min(vert_axis) + min_shift
+            # Add the number of new samples as a result of the shift.
+            new_sample_dim += int(np.ceil(vert_ext / self.sample_thickness))
+
+        # Create the new vertical axis.  The axis is built in the dtype of
+        # the existing axis so it isn't promoted to float64.
+        dtype = vert_axis.dtype.type
+        new_axis = (np.arange(new_sample_dim, dtype=vert_axis.dtype) *
+                dtype(self.sample_thickness)) + \
+                dtype(np.min(vert_axis) + min_shift)
 
         # Check if this is not a constant shift.
         if vert_ext != 0:
             # Not a constant, work through the 2d attributes and interpolate
             # the sample data.
 
-            # First convert to linear units if required.
-            if self.is_log:
-                is_log = True
-                self.to_linear()
-            else:
-                is_log = False
-
-            # Iterate through the pings and interpolate.
-            for ping in range(self.n_pings):
-                self.data[ping, :] = np.interp(
-                    new_axis, vert_axis + vert_shift[ping],
-                    self.data[ping, :old_samps], left=np.nan, right=np.nan)
+            vert_shift = np.asarray(vert_shift, dtype='float64')
+            if vert_shift.shape[0] != self.n_pings:
+                raise ValueError('The vertical shift must be a scalar or ' +
+                        'a vector n_pings long.')
 
-            # Convert back to log units if required.
-            if is_log:
-                self.to_log()
+            # The neighbors and weights for the numpy path are computed once
+            # for all of the attributes that need them.
+            weights = None
+            for attr_name in self._2d_attributes:
+                attr = getattr(self, attr_name)
+                # Only the sample data are in log form.
+                is_log = self.is_log and attr_name == 'data'
+                if numba is not None and attr.dtype in _COMPILED_DTYPES:
+                    # Use the compiled kernel to interpolate the pings.
+                    new_attr = np.empty((self.n_pings, new_sample_dim),
+                            dtype=attr.dtype)
+                    _batched_interp(new_attr, attr, vert_axis, new_axis,
+                            vert_shift, is_log)
+                else:
+                    # Each ping's samples are located at vert_axis +
+                    # vert_shift[ping].
+                    if weights is None:
+                        weights = _interp_weights(vert_axis, new_axis,
+                                shifts=vert_shift)
+                    new_attr = _interp_samples(attr, *weights, is_log=is_log)
+                setattr(self, attr_name, new_attr)
+            self.n_samples = new_sample_dim
 
         # Assign the new axis.
         if to_depth:
@@ -599,7 +999,7 @@ class ProcessedData(PingData):
             self.remove_attribute('range')
         else:
             # No conversion, just assign the new vertical axis data.
-            vert_axis = new_axis
+            setattr(self, vert_axis_name, new_axis)
 
 
     def to_linear(self):
@@ -608,16 +1008,18 @@ class ProcessedData(PingData):
         if not self.is_log:
             return
 
-        # Convert the "known" types.
+        # Convert the data in-place to avoid allocating temporary arrays.
+        # The constants match the data type so float32 data aren't upcast.
+        dtype = self.data.dtype.type
+        self.data *= dtype(0.1)
+        np.power(dtype(10.0), self.data, out=self.data)
+
+        # Update the "known" types.  For other types we're going to assume
+        # you know what you're doing.
         if self.data_type == 'Sv':
-            self.data[:] = 10.0 ** (self.data / 10.0)
             self.data_type = 'sv'
         elif self.data_type == 'Sp':
-            self.data[:] = 10.0 ** (self.data / 10.0)
             self.data_type = 'sp'
-        else:
-            # We're going to assume you know what you're doing.
-            self.data[:] = 10.0 ** (self.data / 10.0)
 
         # Set the is_log flag.
         self.is_log = False
@@ -629,16 +1031,17 @@ class ProcessedData(PingData):
         if self.is_log:
             return
 
-        # Convert the "known" types.
+        # Convert the data in-place to avoid allocating temporary arrays.
+        # The constants match the data type so float32 data aren't upcast.
+        np.log10(self.data, out=self.data)
+        self.data *= self.data.dtype.type(10.0)
+
+        # Update the "known" types.  For other types we're going to assume
+        # you know what you're doing.
         if self.data_type == 'sv':
-            self.data[:] = 10.0 * np.log10(self.data)
             self.data_type = 'Sv'
         elif self.data_type == 'sp':
-            self.data[:] = 10.0 * np.log10(self.data)
             self.data_type = 'Sp'
-        else:
-            # We're going to assume you know what you're doing.
-            self.data[:] = 10.0 * np.log10(self.data)
 
         # Set the is_log flag.
         self.is_log = True
@@ -658,43 +1061,37 @@ class ProcessedData(PingData):
             AttributeError: Range and depth missing.
         """
 
-        # Get the existing vertical axis.
-        if hasattr(self, 'range'):
-            old_vaxis = getattr(self, 'range').copy()
-        elif hasattr(self, 'depth'):
-            old_vaxis = getattr(self, 'depth').copy()
-        else:
-            raise AttributeError('The data object has neither'
-                                 ' a range nor depth attribute.')
-
-        # Check if we need to vertically resize our sample data.
-        if new_vaxis.shape[0] != self.n_samples:
-            self.resize(self.n_pings, new_vaxis.shape[0])
-        else:
-            # They are the same length.  Check if they are identical.
-            if np.all(np.isclose(old_vaxis, new_vaxis)):
-                # They are identical.  Nothing to do.
-                return
+        # Get the existing vertical axis.  We don't need to copy it since it
+        # isn't modified here and it is replaced, not resized, below.
+        old_vaxis = self._vaxis
+
+        # Check if the vertical axes are identical.  insert and replace
+        # always call this method so this is a common case.  An exact match
+        # is checked first since it is much cheaper than allclose.
+        if (new_vaxis.shape[0] == self.n_samples and
+                (np.array_equal(old_vaxis, new_vaxis) or
+                np.allclose(old_vaxis, new_vaxis))):
+            # They are identical.  Nothing to do.
+            return
 
         # Update our sample thickness.
         self.sample_thickness = np.mean(np.ediff1d(new_vaxis))
 
-        # Convert to linear units if required.
-        if self.is_log:
-            is_log = True
-            self.to_linear()
-        else:
-            is_log = False
-
-        # Interpolate sample data.
-        for ping in range(self.n_pings):
-            self.data[ping, :] = np.interp(
-                new_vaxis, old_vaxis, self.data[ping,:old_vaxis.shape[0]],
-                left=np.nan, right=np.nan)
+        # Interpolate the sample data.  Log sample data are converted to
+        # linear units as part of the interpolation, the other 2d attributes
+        # are interpolated as they are.  The vertical axis is shared by
+        # all pings so the neighbors and weights only need to be computed
+        # once.  This vectorized path is faster than the compiled kernel used
+        # by shift_pings, which has to compute them for each ping.
+        idx, weight, out_of_bounds = _interp_weights(old_vaxis, new_vaxis)
+        for attr_name in self._2d_attributes:
+            setattr(self, attr_name, _interp_samples(
+                    getattr(self, attr_name), idx, weight, out_of_bounds,
+                    is_log=self.is_log and attr_name == 'data'))
 
-        # Convert back to log units if required.
-        if is_log:
-            self.to_log()
+        # Update the vertical axis.
+        setattr(self, self._vaxis_name, new_vaxis.copy())
+        self.n_samples = new_vaxis.shape[0]
 
 
     def resize(self, new_ping_dim, new_sample_dim):
@@ -710,19 +1107,26 @@ class ProcessedData(PingData):
                 (vertical axis).
         """
 
-        # Get the existing vertical axis.
-        if hasattr(self, 'range'):
-            vaxis = getattr(self, 'range')
+        # Generate the new vertical axis if the number of samples is
+        # changing.  The axis is built in the dtype of the existing axis.
+        new_sample_dim = int(new_sample_dim)
+        if new_sample_dim != self.n_samples:
+            vaxis = self._vaxis
+            dtype = vaxis.dtype.type
+            new_vaxis = (np.arange(new_sample_dim, dtype=vaxis.dtype) *
+                    dtype(self.sample_thickness)) + vaxis[0]
         else:
-            vaxis = getattr(self, 'depth')
-
-        # Generate the new vertical axis.
-        vaxis = np.arange(new_sample_dim) * self.sample_thickness + vaxis[0]
+            new_vaxis = None
 
         # Call the parent method to resize the arrays (n_samples is updated
         # here).
         super(ProcessedData, self).resize(new_ping_dim, new_sample_dim)
 
+        # Update the vertical axis.  The parent method resizes it but doesn't
+        # know how to extend it.
+        if new_vaxis is not None:
+            setattr(self, self._vaxis_name, new_vaxis)
+
         # Update n_pings.
         self.n_pings = self.ping_time.shape[0]
 
@@ -754,14 +1158,10 @@ class ProcessedData(PingData):
                 # data.
                 sample_mask = key.mask
             else:
-                # This is a ping based mask.  Create a 2d array based on the
-                # mask to apply to the data.
-                sample_mask = np.full((self.n_pings, self.n_samples), False,
-                                      dtype=bool)
-
-                # Set all samples to True for each ping set True in the ping
-                # mask.
-                sample_mask[key.mask, :] = True
+                # This is a ping based mask.  All samples are selected for
+                # each ping set True in the mask so we can simply select the
+                # rows instead of creating a 2d mask.
+                sample_mask = (key.mask, slice(None))
         else:
             # Assume we've been passed slice objects.  Just pass them along.
             sample_mask = key
@@ -771,6 +1171,13 @@ class ProcessedData(PingData):
             # It is a ProcessedData object.  Check if it's compatible.
             self._is_like_me(value)
 
+            if isinstance(key, mask.Mask) and key.type.lower() == 'sample':
+                # Copy the masked samples directly.  This avoids gathering
+                # the masked samples from the other object into a temporary
+                # array and then scattering them into ours.
+                np.copyto(self.data, value.data, where=sample_mask)
+                return
+
             # Get a view of the sliced sample data.
             other_data = value.data[sample_mask]
         else:
@@ -779,6 +1186,15 @@ class ProcessedData(PingData):
             # sample data array.
             other_data = value
 
+            # Ping masks select whole rows, but like sample masks (and
+            # __getitem__) they accept a 1d array containing the selected
+            # samples.  Shape it to the selected rows.
+            if (isinstance(key, mask.Mask) and key.type.lower() == 'ping' and
+                    isinstance(value, np.ndarray) and value.ndim == 1):
+                n_selected = np.count_nonzero(key.mask)
+                if value.shape[0] == n_selected * self.n_samples:
+                    other_data = value.reshape(n_selected, self.n_samples)
+
         # Set the sample data to the provided value(s).
         self.data[sample_mask] = other_data
 
@@ -823,14 +1239,10 @@ class ProcessedData(PingData):
                 # data.
                 sample_mask = key.mask
             else:
-                # This is a ping based mask - create a 2d array based on the
-                # mask to apply to the data.
-                sample_mask = np.full((self.n_pings, self.n_samples), False,
-                                      dtype=bool)
-
-                # Set all samples to True for each ping set True in the ping
-                # mask
-                sample_mask[key.mask, :] = True
+                # This is a ping based mask.  Select the rows set True in the
+                # mask and return the samples as a 1d array, which is what
+                # applying the equivalent 2d mask would return.
+                return self.data[key.mask, :].ravel()
 
         else:
             # Assume we've been passed slice objects.  Just pass them along.
@@ -849,11 +1261,17 @@ class ProcessedData(PingData):
             mask (Mask): A mask object.
 
         Raises:
+            TypeError: The mask array is not a bool array.
             ValueError: Ranges do not match.
             AttributeError: Can't compare range mask with depth mask.
             ValueError: Depths do not match.
 
         """
+        # The mask array is used directly as a boolean index.  An integer
+        # array would be treated as a list of indices instead.
+        if mask.mask.dtype != bool:
+            raise TypeError('The mask array must be a numpy bool array.')
+
         # Check the ping times and make sure they match.
         if not np.array_equal(self.ping_time, mask.ping_time):
             raise ValueError('Mask ping times do not match the data ping '
@@ -861,9 +1279,9 @@ class ProcessedData(PingData):
 
         # Make sure the mask's vertical axis is the same.  If it exists,
         # ping masks will not have one.
-        if hasattr(mask, 'range'):
+        if 'range' in mask.__dict__:
             # Mask has range.  Check if we have range.
-            if hasattr(self, 'range'):
+            if self._vaxis_name == 'range':
                 # We have range.  Make sure they are the same.
                 if not np.array_equal(self.range, mask.range):
                     raise ValueError(
@@ -873,9 +1291,9 @@ class ProcessedData(PingData):
                 # that.
                 raise AttributeError('You cannot compare a range based mask '
                                      'with depth based data.')
-        elif hasattr(mask, 'depth'):
+        elif 'depth' in mask.__dict__:
             # Mask has depth.  Check if we have depth.
-            if hasattr(self, 'depth'):
+            if self._vaxis_name == 'depth':
                 # We have depth.  Make sure they are the same.
                 if not np.array_equal(self.depth, mask.depth):
                     raise ValueError(
@@ -903,23 +1321,31 @@ class ProcessedData(PingData):
             ValueError: Depths do not match.
         """
 
-        # Check the ping times and make sure they match.
-        if not np.array_equal(self.ping_time, pd_object.ping_time):
+        # We are always like ourself.
+        if pd_object is self:
+            return
+
+        # Check the ping times and make sure they match.  Objects that share
+        # their axes (e.g. views) don't need the element-by-element check.
+        if (pd_object.ping_time is not self.ping_time and
+                not np.array_equal(self.ping_time, pd_object.ping_time)):
             raise ValueError("The ProcessedData object's ping times do not "
                              "match our ping times.")
 
         # Make sure the vertical axis is the same.
-        if hasattr(pd_object, 'range'):
-            if hasattr(self, 'range'):
-                if not np.array_equal(self.range, pd_object.range):
+        if pd_object._vaxis_name == 'range':
+            if self._vaxis_name == 'range':
+                if (pd_object.range is not self.range and
+                        not np.array_equal(self.range, pd_object.range)):
                     raise ValueError("The ProcessedData object's ranges do "
                                      "not match our ranges.")
             else:
                 raise AttributeError('You cannot operate on a range based '
                                      'object with a depth based object.')
         else:
-            if hasattr(self, 'depth'):
-                if not np.array_equal(self.depth, mask.depth):
+            if self._vaxis_name == 'depth':
+                if (pd_object.depth is not self.depth and
+                        not np.array_equal(self.depth, pd_object.depth)):
                     raise ValueError("The ProcessedData object's depths do "
                                      "not match our depths.")
             else:
@@ -944,7 +1370,7 @@ class ProcessedData(PingData):
         compare_mask, other_data = self._setup_compare(other)
 
         # Set the mask.
-        compare_mask.mask[:] = self.data > other_data
+        self._compare(np.greater, other_data, compare_mask.mask)
 
         # Restore the error settings we disabled in _setup_compare.
         np.seterr(**self._old_npset)
@@ -969,7 +1395,7 @@ class ProcessedData(PingData):
         compare_mask, other_data = self._setup_compare(other)
 
         # Set the mask.
-        compare_mask.mask[:] = self.data < other_data
+        self._compare(np.less, other_data, compare_mask.mask)
 
         # Restore the error settings we disabled in _setup_compare.
         np.seterr(**self._old_npset)
@@ -994,7 +1420,7 @@ class ProcessedData(PingData):
         compare_mask, other_data = self._setup_compare(other)
 
         # Set the mask.
-        compare_mask.mask[:] = self.data >= other_data
+        self._compare(np.greater_equal, other_data, compare_mask.mask)
 
         # Restore the error settings we disabled in _setup_compare.
         np.seterr(**self._old_npset)
@@ -1015,13 +1441,13 @@ class ProcessedData(PingData):
         Returns:
             A mask object containing the results of the comparison.
         """
-        #  get the new mask and data references
+        # Get the new mask and data references.
         compare_mask, other_data = self._setup_compare(other)
 
-        #  and set the mask
-        compare_mask.mask[:] = self.data <= other_data
+        # Set the mask.
+        self._compare(np.less_equal, other_data, compare_mask.mask)
 
-        #  restore the error settings we disabled in _setup_compare
+        # Restore the error settings we disabled in _setup_compare.
         np.seterr(**self._old_npset)
 
         return compare_mask
@@ -1034,17 +1460,24 @@ class ProcessedData(PingData):
         numpy array or a scalar value. The comparison operators always do a
         element-by-element comparison and return the results in a sample mask.
 
+        Comparing to None returns NotImplemented so Python falls back to
+        its identity comparison (i.e. "p_data == None" is False) instead of
+        comparing every sample.
+
         Args:
             other: a ProcessedData object, numpy array, or scalar value.
 
         Returns:
             A mask object containing the results of the comparison.
         """
+        if other is None:
+            return NotImplemented
+
         # Get the new mask and data references.
         compare_mask, other_data = self._setup_compare(other)
 
         # Set the mask.
-        compare_mask.mask[:] = self.data == other_data
+        self._compare(np.equal, other_data, compare_mask.mask)
 
         # Restore the error settings we disabled in _setup_compare.
         np.seterr(**self._old_npset)
@@ -1059,17 +1492,24 @@ class ProcessedData(PingData):
         numpy array or a scalar value. The comparison operators always do a
         element-by-element comparison and return the results in a sample mask.
 
+        Comparing to None returns NotImplemented so Python falls back to
+        its identity comparison (i.e. "p_data != None" is True) instead of
+        comparing every sample.
+
         Args:
             other: a ProcessedData object, numpy array, or scalar value.
 
         Returns:
             A mask object containing the results of the comparison.
         """
+        if other is None:
+            return NotImplemented
+
         # Get the new mask and data references.
         compare_mask, other_data = self._setup_compare(other)
 
         # Set the mask.
-        compare_mask.mask[:] = self.data != other_data
+        self._compare(np.not_equal, other_data, compare_mask.mask)
 
         # Restore the error settings we disabled in _setup_compare.
         np.seterr(**self._old_npset)
@@ -1077,6 +1517,83 @@ class ProcessedData(PingData):
         return compare_mask
 
 
+    def threshold_masks(self, thresholds):
+        """Returns a sample mask for each of the provided thresholds.
+
+        The masks are the same as those returned by the ">" operator for each
+        threshold (i.e. p_data > thresholds[k]) but when Numba is available
+        and the sample data are large, they are computed in a single pass
+        through the sample data.
+
+        Args:
+            thresholds (list): A list or 1d numpy array of scalar thresholds.
+
+        Returns:
+            A list of mask objects, one for each threshold.
+        """
+        n_thresholds = len(thresholds)
+
+        # Create the mask arrays.  The results of each comparison are written
+        # into their own (n_pings, n_samples) slice of this array.
+        mask_data = np.empty((n_thresholds,) + self.data.shape, dtype=bool)
+
+        # Disable warning for comparing NaNs.
+        old_npset = np.seterr(invalid='ignore')
+
+        # The kernel compares in the sample data type.  Like _compare, only
+        # use it if numpy would compare each threshold in that type so the
+        # masks match the ">" operator.
+        if (numba is not None and self.data.dtype in _COMPILED_DTYPES and
+                self.data.size >= _COMPILED_COMPARE_MIN_SIZE and
+                all(np.result_type(self.data, threshold) == self.data.dtype
+                    for threshold in thresholds)):
+            _greater_multi(mask_data, self.data,
+                    np.array(thresholds, dtype=self.data.dtype))
+        else:
+            for k in range(n_thresholds):
+                self._compare(np.greater, thresholds[k], mask_data[k])
+
+        # Restore the error settings.
+        np.seterr(**old_npset)
+
+        # Wrap the results in mask objects.
+        masks = []
+        for k in range(n_thresholds):
+            threshold_mask = mask.Mask(like=self, value=None)
+            threshold_mask.mask = mask_data[k]
+            masks.append(threshold_mask)
+
+        return masks
+
+
+    def _compare(self, ufunc, other_data, out):
+        """Compares our sample data to other_data, writing the results
+        into out.
+
+        This is an internal method used by the comparison operators.  The
+        comparison is written directly into the mask array to avoid
+        allocating a temporary boolean array.  Large floating point arrays
+        compared to a scalar are compared in parallel if Numba is available.
+        The kernel compares in the sample data type so it is only used when
+        numpy would also compare in that type.  Otherwise (e.g. a float64
+        scalar or integer sample data compared to a float) the result would
+        depend on the size of the array.
+
+        Args:
+            ufunc (ufunc): The numpy comparison ufunc to apply.
+            other_data: The data returned by _setup_compare.
+            out (array): The boolean array the results are written to.
+        """
+        if (numba is not None and np.isscalar(other_data) and
+                self.data.dtype in _COMPILED_DTYPES and
+                self.data.size >= _COMPILED_COMPARE_MIN_SIZE and
+                np.result_type(self.data, other_data) == self.data.dtype):
+            _compare_scalar(out, self.data, self.data.dtype.type(other_data),
+                    _COMPARE_OPS[ufunc])
+        else:
+            ufunc(self.data, other_data, out=out)
+
+
     def _setup_operators(self, other):
         """Determines if we can apply the operators.
 
@@ -1085,6 +1602,12 @@ class ProcessedData(PingData):
         to the sample data and performs some basic checks to ensure that we can
         *probably* successfully apply the operator.
 
+        In addition to arrays the same shape as our sample data, 1d arrays
+        containing a value per sample or a value per ping are accepted.  These
+        are returned reshaped so they broadcast along the pings or samples
+        respectively.  If the number of pings and samples are the same, a 1d
+        array is assumed to contain a value per sample.
+
         Args:
             other: a ProcessedData object, numpy array, or scalar value.
 
@@ -1103,6 +1626,16 @@ class ProcessedData(PingData):
             # Get the references to the other sample data array.
             other_data = other.data
 
+        elif isinstance(other, np.ndarray) and other.ndim == 1 and \
+                other.shape[0] in (self.n_samples, self.n_pings):
+            # The comparison data is a vector of per sample or per ping
+            # values.  Shape it so it broadcasts along the other axis.
+            other = np.ascontiguousarray(other)
+            if other.shape[0] == self.n_samples:
+                other_data = other[np.newaxis, :]
+            else:
+                other_data = other[:, np.newaxis]
+
         elif isinstance(other, np.ndarray):
             # The comparison data is a numpy array.  Check its shape.
             if other.shape != self.data.shape:
@@ -1135,8 +1668,9 @@ class ProcessedData(PingData):
         # Do some checks and get references to the data.
         other_data = self._setup_operators(other)
 
-        # Create the mask we will return.
-        compare_mask = mask.Mask(like=self)
+        # Create the mask we will return.  The comparison operators write
+        # every element of the mask so we don't need to initialize it.
+        compare_mask = mask.Mask(like=self, value=None)
 
         # Disable warning for comparing NaNs.
         self._old_npset = np.seterr(invalid='ignore')
@@ -1162,8 +1696,10 @@ class ProcessedData(PingData):
         # If we're not operating in-place, create a ProcessedData object to
         # return.
         if not inplace:
-            # Return references to a new pd object.
-            op_result = self.empty_like()
+            # Return references to a new pd object.  The operators overwrite
+            # all of the sample data so we only need to fill the arrays if
+            # there are other 2d attributes.
+            op_result = self.empty_like(fill=len(self._2d_attributes) > 1)
         else:
             # We're operating in-place.  Return references to our self.
             op_result = self
@@ -1434,43 +1970,41 @@ class ProcessedData(PingData):
             A string with information about the ProcessedData instance.
         """
 
-        #  print the class and address
-        msg = str(self.__class__) + " at " + str(hex(id(self))) + "\n"
+        # Print the class and address.  The message is built as a list of
+        # strings which are joined once at the end.
+        msg = [str(self.__class__), " at ", str(hex(id(self))), "\n"]
 
-        #  print some more info about the ProcessedData instance
+        # Print some more info about the ProcessedData instance.
         n_pings = len(self.ping_time)
         if n_pings > 0:
-            msg = msg + "                channel(s): ["
-            for channel in self.channel_id:
-                msg = msg + channel + ", "
-            msg = msg[0:-2] + "]\n"
-            msg = (msg + "                 frequency: " + str(self.frequency)
-                   + "\n")
-            msg = (msg + "           data start time: " + str(self.ping_time[
-                                                                  0]) + "\n")
-            msg = (msg + "             data end time: " + str(self.ping_time[
-                                                                  n_pings-1])
-                   + "\n")
-            msg = msg + "            number of pings: " + str(n_pings) + "\n"
-            msg = msg + "            data attributes:"
-            n_attr = 0
+            msg += ["                channel(s): [",
+                    ", ".join(self.channel_id), "]\n",
+                    "                 frequency: ", str(self.frequency), "\n",
+                    "           data start time: ", str(self.ping_time[0]),
+                    "\n",
+                    "             data end time: ",
+                    str(self.ping_time[n_pings-1]), "\n",
+                    "            number of pings: ", str(n_pings), "\n",
+                    "            data attributes:"]
             padding = " "
             for attr_name in self._data_attributes:
                 attr = getattr(self, attr_name)
-                if n_attr > 0:
-                    padding = "                            "
-                if isinstance(attr, np.ndarray):
-                    if attr.ndim == 1:
-                        msg = msg + padding + attr_name + " (%u)\n" % (
-                            attr.shape[0])
-                    else:
-                        msg = msg + padding + attr_name + " (%u,%u)\n" % (
-                            attr.shape[0], attr.shape[1])
+
+                # The names of the 2d attributes are tracked by
+                # add_attribute so we only need to check the type of the
+                # others.
+                if attr_name in self._2d_attributes:
+                    dims = " (%u,%u)\n" % (attr.shape[0], attr.shape[1])
+                elif isinstance(attr, np.ndarray):
+                    dims = " (%u)\n" % (attr.shape[0])
                 elif isinstance(attr, list):
-                        msg = msg + padding + attr_name + " (%u)\n" % (len(
-                            attr))
-                n_attr += 1
+                    dims = " (%u)\n" % (len(attr))
+                else:
+                    dims = None
+                if dims is not None:
+                    msg += [padding, attr_name, dims]
+                padding = "                            "
         else:
-            msg = msg + "  ProcessedData object contains no data\n"
+            msg.append("  ProcessedData object contains no data\n")
 
-        return msg
+        return "".join(msg)
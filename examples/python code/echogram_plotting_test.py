@@ -3,14 +3,15 @@
 
 import numpy as np
 from matplotlib.pyplot import figure, show
-from echolab2.processing import processed_data, line
+from matplotlib.collections import LineCollection
+from echolab2.processing import processed_data
 from echolab2.plotting.matplotlib import echogram
 
 
 test_data_pings = 100
 test_data_samples = 1000
 sample_thickness_m = 0.5
-ping_interval_ms = 1000.0
+ping_interval_ms = 1000
 
 
 fake_Sv = processed_data.ProcessedData('Fake Data', 120000, 'Sv')
@@ -19,29 +20,54 @@ fake_Sv.n_pings = test_data_pings
 
 # Create some fake data arrays.
 ranges = np.arange(test_data_samples) * sample_thickness_m
-times = (np.arange(test_data_pings) * ping_interval_ms) + \
-        np.datetime64('2018-03-21T03:30:30', 'ms').astype('float')
-data = np.zeros((test_data_pings, test_data_samples), dtype='float32')
-data[:, 1::2] = 10.0
+times = np.datetime64('2018-03-21T03:30:30', 'ms') + \
+        np.arange(test_data_pings) * np.timedelta64(ping_interval_ms, 'ms')
+row = np.tile(np.array([0.0, 10.0], dtype='float32'), test_data_samples // 2)
+data = np.tile(row, (test_data_pings, 1))
 
 # Add the fake data to the ProcessedData object.
 fake_Sv.add_attribute('range', ranges)
-fake_Sv.add_attribute('ping_time', times.astype('datetime64[ms]'))
+fake_Sv.add_attribute('ping_time', times)
 fake_Sv.add_attribute('data', data)
 
-# Create lines.
-a_line = line.Line(ping_time=np.array([times[0], times[-1]]), data=np.array([
-    0, 0]))
-n_lines = int((ranges[-1] / (sample_thickness_m * 10)) + 0.5)
+# Create the horizontal lines as line segments, one every 10 samples, that
+# span the echogram.  Each segment is [[x0, y0], [x1, y1]] where x is the
+# ping time as a float.
+line_step = sample_thickness_m * 10
+n_lines = int((ranges[-1] / line_step) + 0.5)
+segments = np.empty((n_lines, 2, 2))
+segments[:, :, 0] = times[[0, -1]].astype('float')
+segments[:, :, 1] = (np.arange(n_lines) * line_step)[:, np.newaxis]
 
 # Create a matplotlib figure to plot our echograms on.
 fig_1 = figure()
 eg = echogram.Echogram(fig_1, fake_Sv, threshold=[0, 20])
 eg.axes.set_title("Echogram Plot Test")
 
-for i in range(n_lines):
-    eg.plot_line(a_line, linewidth=1.0)
-    a_line = a_line + (sample_thickness_m * 10)
+# Plot all of the lines as a single collection.
+line_collection = LineCollection(segments, colors=[[0.58, 0.0, 0.83]],
+                                 linewidths=1.0)
+eg.axes.add_collection(line_collection)
+
+
+def move_lines(event):
+    """Moves the lines up or down a sample when the up/down keys are pressed.
+
+    This demonstrates updating the plotted lines.  The y values of the
+    existing segments are updated in place and handed back to the collection
+    so no new artists are created.
+    """
+    if event.key == 'up':
+        segments[:, :, 1] -= sample_thickness_m
+    elif event.key == 'down':
+        segments[:, :, 1] += sample_thickness_m
+    else:
+        return
+    line_collection.set_segments(segments)
+    fig_1.canvas.draw_idle()
+
+
+fig_1.canvas.mpl_connect('key_press_event', move_lines)
 
 # Display figure.
 show()
@@ -13,6 +13,7 @@ setuptools.setup(
     long_description_content_type = "text/markdown",
     url = "https://github.com/CI-CMG/pyEcholab",
     packages = setuptools.find_packages(),
+    extras_require = {"numba": ["numba"]},
     classifiers=["Programming Language :: Python :: 3",
                  "License :: OSI Approved :: MIT License",
                  "Operating System :: OS Independent",
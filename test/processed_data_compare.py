@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+This script checks ProcessedData sample data interpolation and ping mask
+indexing against simple reference implementations.
+
+interpolate and shift_pings are compared to np.interp run on each ping, which
+is how these methods were originally implemented.  If numba is installed, the
+compiled shift_pings and comparison kernels are also compared to the numpy
+code paths.  Lastly, getting and setting sample data with ping masks is
+compared to indexing the sample data array with the equivalent sample mask.
+
+The script doesn't need any data files.  It raises an AssertionError if a
+check fails.
+"""
+
+import numpy as np
+from echolab2.processing import processed_data, mask
+
+
+def make_data(n_pings=9, n_samples=200, sample_thickness=0.1,
+        dtype='float32', is_log=True, seed=0):
+    '''
+    make_data creates a ProcessedData object filled with random Sv-like data.
+    One ping is all NaN and every tenth sample of another ping is NaN.
+    '''
+    rng = np.random.RandomState(seed)
+    p_data = processed_data.ProcessedData('test_channel', 38000, 'Sv')
+    p_data.sample_thickness = sample_thickness
+    p_data.is_log = is_log
+    p_data.add_attribute('ping_time',
+            np.arange(n_pings).astype('datetime64[s]'))
+    data = (rng.random_sample((n_pings, n_samples)) * -60 - 30).astype(dtype)
+    data[2, :] = np.nan
+    data[3, ::10] = np.nan
+    p_data.add_attribute('data', data)
+    p_data.add_attribute('range',
+            np.arange(n_samples) * sample_thickness + 1.0)
+
+    return p_data
+
+
+def reference_interp(data, old_axis, new_axis, shifts, is_log):
+    '''
+    reference_interp interpolates each ping with np.interp.  The samples of
+    each ping are located at old_axis + shifts[ping].
+    '''
+    result = np.empty((data.shape[0], new_axis.shape[0]))
+    for ping in range(data.shape[0]):
+        samples = data[ping, :].astype('float64')
+        if is_log:
+            samples = 10.0 ** (samples / 10.0)
+        samples = np.interp(new_axis, old_axis + shifts[ping], samples,
+                left=np.nan, right=np.nan)
+        if is_log:
+            samples = 10.0 * np.log10(samples)
+        result[ping, :] = samples
+
+    return result
+
+
+def assert_same(result, expected):
+    '''
+    assert_same checks that two sample data arrays have NaNs in the same
+    places and that the rest of the samples are equal to within float32
+    precision.
+    '''
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    np.testing.assert_allclose(result, expected, rtol=1e-4, atol=1e-3,
+            equal_nan=True)
+
+
+def check_interpolate():
+    '''
+    check_interpolate compares interpolate to np.interp.  Upsampling by an
+    odd factor puts new samples within an ulp of existing samples which must
+    be treated as exact hits.  2d attributes that aren't in log form and
+    integer 2d attributes are checked too.
+    '''
+    for dtype in ('float32', 'float64'):
+        for is_log in (True, False):
+            for factor in (0.5, 1.5, 3.0, 5.0):
+                p_data = make_data(dtype=dtype, is_log=is_log)
+                rng = np.random.RandomState(2)
+                angle = rng.uniform(-3, 3, p_data.data.shape)
+                p_data.add_attribute('angle', angle)
+                flags = rng.randint(0, 4, p_data.data.shape).astype('int8')
+                p_data.add_attribute('flags', flags)
+                old_axis = p_data.range.copy()
+                n_samples = int((p_data.n_samples - 1) * factor) + 1
+                new_axis = np.arange(n_samples) * (p_data.sample_thickness /
+                        factor) + old_axis[0] + 0.01
+
+                no_shift = np.zeros(p_data.n_pings)
+                expected = reference_interp(p_data.data, old_axis, new_axis,
+                        no_shift, is_log)
+                expected_angle = reference_interp(angle, old_axis, new_axis,
+                        no_shift, False)
+                expected_flags = reference_interp(flags, old_axis, new_axis,
+                        no_shift, False)
+                p_data.interpolate(new_axis)
+
+                assert_same(p_data.data, expected)
+                assert_same(p_data.angle, expected_angle)
+                assert_same(p_data.flags, expected_flags)
+                assert p_data.data.dtype == dtype
+                assert p_data.n_samples == n_samples
+    print('interpolate matches np.interp')
+
+
+def check_shift_pings():
+    '''
+    check_shift_pings compares shift_pings to np.interp for random shifts.
+    The first and last valid samples of each ping are where rounding would
+    show up.
+    '''
+    rng = np.random.RandomState(1)
+    for trial in range(100):
+        for dtype in ('float32', 'float64'):
+            p_data = make_data(n_samples=40, dtype=dtype,
+                    sample_thickness=rng.random_sample() * 0.7 + 0.05,
+                    is_log=bool(trial % 2), seed=trial)
+            shifts = rng.random_sample(p_data.n_pings) * 3
+            old_axis = p_data.range.copy()
+            expected_data = p_data.data.copy()
+
+            p_data.shift_pings(shifts)
+
+            expected = reference_interp(expected_data, old_axis,
+                    p_data.range, shifts, p_data.is_log)
+            assert_same(p_data.data, expected)
+    print('shift_pings matches np.interp')
+
+
+def check_compiled():
+    '''
+    check_compiled compares the numba compiled kernels to the numpy code
+    paths.
+    '''
+    if processed_data.numba is None:
+        print('numba is not installed, skipping the compiled kernel checks')
+        return
+
+    # The comparison kernels are only used for large data sets.
+    n_pings = 600
+    n_samples = (processed_data._COMPILED_COMPARE_MIN_SIZE // n_pings) + 1
+    shifts = np.linspace(0, 2.55, n_pings)
+    thresholds = [-70, -60.5, -50]
+
+    results = []
+    numba = processed_data.numba
+    try:
+        for module_numba in (numba, None):
+            processed_data.numba = module_numba
+            p_data = make_data(n_pings=n_pings, n_samples=n_samples)
+            result = [(p_data > -60.5).mask, (p_data <= -45).mask,
+                    (p_data != p_data.data[0, 0]).mask]
+            result += [m.mask for m in p_data.threshold_masks(thresholds)]
+            p_data.shift_pings(shifts)
+            result.append(p_data.data)
+            results.append(result)
+    finally:
+        processed_data.numba = numba
+
+    for compiled, vectorized in zip(*results):
+        if compiled.dtype == bool:
+            np.testing.assert_array_equal(compiled, vectorized)
+        else:
+            assert_same(compiled, vectorized)
+    print('numba kernels match the numpy code paths')
+
+
+def check_ping_masks():
+    '''
+    check_ping_masks gets and sets sample data using ping masks and compares
+    the results to indexing the data with the equivalent sample mask.
+    '''
+    p_data = make_data(n_samples=50)
+    ping_mask = mask.Mask(like=p_data, type='ping')
+    ping_mask.mask[[1, 4, 5]] = True
+    sample_mask = np.zeros(p_data.data.shape, dtype=bool)
+    sample_mask[[1, 4, 5], :] = True
+
+    # Get.
+    np.testing.assert_array_equal(p_data[ping_mask], p_data.data[sample_mask])
+
+    # Set with a scalar.
+    other = p_data.copy()
+    other[ping_mask] = 5.0
+    expected = p_data.data.copy()
+    expected[sample_mask] = 5.0
+    np.testing.assert_array_equal(other.data, expected)
+
+    # Set with another ProcessedData object.
+    source = p_data.copy()
+    source.data[:] = np.arange(source.data.size).reshape(source.data.shape)
+    other = p_data.copy()
+    other[ping_mask] = source
+    expected = p_data.data.copy()
+    expected[sample_mask] = source.data[sample_mask]
+    np.testing.assert_array_equal(other.data, expected)
+
+    # Round-trip the masked samples back into the modified object.
+    other[ping_mask] = p_data[ping_mask]
+    np.testing.assert_array_equal(other.data, p_data.data)
+    print('ping mask get/set round-trips')
+
+
+if __name__ == '__main__':
+    check_interpolate()
+    check_shift_pings()
+    check_compiled()
+    check_ping_masks()